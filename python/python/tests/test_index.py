@@ -1,5 +1,6 @@
 from datetime import timedelta
 
+import numpy as np
 import pyarrow as pa
 import pytest
 import pytest_asyncio
@@ -13,7 +14,7 @@ async def db_async(tmp_path) -> AsyncConnection:
 
 
 def sample_fixed_size_list_array(nrows, dim):
-    vector_data = pa.array([float(i) for i in range(dim * nrows)], pa.float32())
+    vector_data = pa.array(np.arange(dim * nrows, dtype=np.float32))
     return pa.FixedSizeListArray.from_arrays(vector_data, dim)
 
 
@@ -21,17 +22,18 @@ DIM = 8
 NROWS = 256
 
 
+@pytest.fixture(scope="module")
+def sample_data() -> pa.Table:
+    id_arr = pa.array(np.arange(NROWS, dtype=np.int64))
+    vec_arr = sample_fixed_size_list_array(NROWS, DIM)
+    return pa.Table.from_arrays([id_arr, vec_arr], names=["id", "vector"])
+
+
 @pytest_asyncio.fixture
-async def some_table(db_async):
-    data = pa.Table.from_pydict(
-        {
-            "id": list(range(256)),
-            "vector": sample_fixed_size_list_array(NROWS, DIM),
-        }
-    )
+async def some_table(db_async, sample_data):
     return await db_async.create_table(
         "some_table",
-        data,
+        sample_data,
     )
 
 
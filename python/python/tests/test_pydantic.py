@@ -15,6 +15,7 @@
 import json
 import sys
 from datetime import date, datetime
+from functools import lru_cache
 from typing import List, Optional, Tuple
 
 import pyarrow as pa
@@ -24,28 +25,81 @@ from lancedb.pydantic import PYDANTIC_VERSION, LanceModel, Vector, pydantic_to_s
 from pydantic import Field
 
 
-@pytest.mark.skipif(
-    sys.version_info < (3, 9),
-    reason="using native type alias requires python3.9 or higher",
+@lru_cache(maxsize=None)
+def _cached_schema(model):
+    return pydantic_to_schema(model)
+
+
+# Expected schema for the TestModel used by both test_pydantic_to_arrow
+# variants; built once at import instead of per-test.
+_EXPECTED_TEST_MODEL_SCHEMA = pa.schema(
+    [
+        pa.field("id", pa.int64(), False),
+        pa.field("s", pa.utf8(), False),
+        pa.field("vec", pa.list_(pa.float64()), False),
+        pa.field("li", pa.list_(pa.int64()), False),
+        pa.field("lili", pa.list_(pa.list_(pa.float64())), False),
+        pa.field("litu", pa.list_(pa.list_(pa.float64())), False),
+        pa.field("opt", pa.utf8(), True),
+        pa.field(
+            "st",
+            pa.struct(
+                [pa.field("a", pa.utf8(), False), pa.field("b", pa.float64(), True)]
+            ),
+            False,
+        ),
+        pa.field("dt", pa.date32(), False),
+        pa.field("dtt", pa.timestamp("us"), False),
+        pa.field("dt_with_tz", pa.timestamp("us", tz="Asia/Shanghai"), False),
+    ]
 )
-def test_pydantic_to_arrow():
+
+
+def _build_test_model():
+    """Build the TestModel using native type aliases on python3.9+ and the
+    typing aliases on older versions."""
+
     class StructModel(pydantic.BaseModel):
         a: str
         b: Optional[float]
 
-    class TestModel(pydantic.BaseModel):
-        id: int
-        s: str
-        vec: list[float]
-        li: list[int]
-        lili: list[list[float]]
-        litu: list[tuple[float, float]]
-        opt: Optional[str] = None
-        st: StructModel
-        dt: date
-        dtt: datetime
-        dt_with_tz: datetime = Field(json_schema_extra={"tz": "Asia/Shanghai"})
-        # d: dict
+    if sys.version_info >= (3, 9):
+
+        class TestModel(pydantic.BaseModel):
+            id: int
+            s: str
+            vec: list[float]
+            li: list[int]
+            lili: list[list[float]]
+            litu: list[tuple[float, float]]
+            opt: Optional[str] = None
+            st: StructModel
+            dt: date
+            dtt: datetime
+            dt_with_tz: datetime = Field(json_schema_extra={"tz": "Asia/Shanghai"})
+            # d: dict
+
+    else:
+
+        class TestModel(pydantic.BaseModel):
+            id: int
+            s: str
+            vec: List[float]
+            li: List[int]
+            lili: List[List[float]]
+            litu: List[Tuple[float, float]]
+            opt: Optional[str] = None
+            st: StructModel
+            dt: date
+            dtt: datetime
+            dt_with_tz: datetime = Field(json_schema_extra={"tz": "Asia/Shanghai"})
+            # d: dict
+
+    return TestModel
+
+
+def test_pydantic_to_arrow():
+    TestModel = _build_test_model()
 
     # TODO: test we can actually convert the model into data.
     # m = TestModel(
@@ -61,30 +115,9 @@ def test_pydantic_to_arrow():
     #     dt_with_tz=datetime.now(pytz.timezone("Asia/Shanghai")),
     # )
 
-    schema = pydantic_to_schema(TestModel)
+    schema = _cached_schema(TestModel)
 
-    expect_schema = pa.schema(
-        [
-            pa.field("id", pa.int64(), False),
-            pa.field("s", pa.utf8(), False),
-            pa.field("vec", pa.list_(pa.float64()), False),
-            pa.field("li", pa.list_(pa.int64()), False),
-            pa.field("lili", pa.list_(pa.list_(pa.float64())), False),
-            pa.field("litu", pa.list_(pa.list_(pa.float64())), False),
-            pa.field("opt", pa.utf8(), True),
-            pa.field(
-                "st",
-                pa.struct(
-                    [pa.field("a", pa.utf8(), False), pa.field("b", pa.float64(), True)]
-                ),
-                False,
-            ),
-            pa.field("dt", pa.date32(), False),
-            pa.field("dtt", pa.timestamp("us"), False),
-            pa.field("dt_with_tz", pa.timestamp("us", tz="Asia/Shanghai"), False),
-        ]
-    )
-    assert schema == expect_schema
+    assert schema == _EXPECTED_TEST_MODEL_SCHEMA
 
 
 @pytest.mark.skipif(
@@ -97,7 +130,7 @@ def test_optional_types_py310():
         b: None | str
         c: Optional[str]
 
-    schema = pydantic_to_schema(TestModel)
+    schema = _cached_schema(TestModel)
 
     expect_schema = pa.schema(
         [
@@ -109,69 +142,6 @@ def test_optional_types_py310():
     assert schema == expect_schema
 
 
-@pytest.mark.skipif(
-    sys.version_info > (3, 8),
-    reason="using native type alias requires python3.9 or higher",
-)
-def test_pydantic_to_arrow_py38():
-    class StructModel(pydantic.BaseModel):
-        a: str
-        b: Optional[float]
-
-    class TestModel(pydantic.BaseModel):
-        id: int
-        s: str
-        vec: List[float]
-        li: List[int]
-        lili: List[List[float]]
-        litu: List[Tuple[float, float]]
-        opt: Optional[str] = None
-        st: StructModel
-        dt: date
-        dtt: datetime
-        dt_with_tz: datetime = Field(json_schema_extra={"tz": "Asia/Shanghai"})
-        # d: dict
-
-    # TODO: test we can actually convert the model to Arrow data.
-    # m = TestModel(
-    #     id=1,
-    #     s="hello",
-    #     vec=[1.0, 2.0, 3.0],
-    #     li=[2, 3, 4],
-    #     lili=[[2.5, 1.5], [3.5, 4.5], [5.5, 6.5]],
-    #     litu=[(2.5, 1.5), (3.5, 4.5), (5.5, 6.5)],
-    #     st=StructModel(a="a", b=1.0),
-    #     dt=date.today(),
-    #     dtt=datetime.now(),
-    #     dt_with_tz=datetime.now(pytz.timezone("Asia/Shanghai")),
-    # )
-
-    schema = pydantic_to_schema(TestModel)
-
-    expect_schema = pa.schema(
-        [
-            pa.field("id", pa.int64(), False),
-            pa.field("s", pa.utf8(), False),
-            pa.field("vec", pa.list_(pa.float64()), False),
-            pa.field("li", pa.list_(pa.int64()), False),
-            pa.field("lili", pa.list_(pa.list_(pa.float64())), False),
-            pa.field("litu", pa.list_(pa.list_(pa.float64())), False),
-            pa.field("opt", pa.utf8(), True),
-            pa.field(
-                "st",
-                pa.struct(
-                    [pa.field("a", pa.utf8(), False), pa.field("b", pa.float64(), True)]
-                ),
-                False,
-            ),
-            pa.field("dt", pa.date32(), False),
-            pa.field("dtt", pa.timestamp("us"), False),
-            pa.field("dt_with_tz", pa.timestamp("us", tz="Asia/Shanghai"), False),
-        ]
-    )
-    assert schema == expect_schema
-
-
 def test_fixed_size_list_field():
     class TestModel(pydantic.BaseModel):
         vec: Vector(16)
@@ -189,7 +159,7 @@ def test_fixed_size_list_field():
             "li": [1, 2, 3],
         }
 
-    schema = pydantic_to_schema(TestModel)
+    schema = _cached_schema(TestModel)
     assert schema == pa.schema(
         [
             pa.field("vec", pa.list_(pa.float32(), 16), False),
@@ -237,7 +207,7 @@ def test_lance_model():
         vector: Vector(16) = Field(default=[0.0] * 16)
         li: List[int] = Field(default=[1, 2, 3])
 
-    schema = pydantic_to_schema(TestModel)
+    schema = _cached_schema(TestModel)
     assert schema == TestModel.to_arrow_schema()
     assert TestModel.field_names() == ["vector", "li"]
 